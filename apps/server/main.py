@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -53,7 +55,6 @@ async def health_check():
 @app.get("/api/hello", response_model=MessageResponse)
 async def hello():
     """Simple hello endpoint."""
-    from datetime import datetime
     return MessageResponse(
         message="Hello from Lumi API!",
         timestamp=datetime.now().isoformat()